@@ -1,8 +1,10 @@
 import itertools
-from multiprocessing import Pool, freeze_support
+import multiprocessing as mp
+import sys
+from collections import defaultdict
+from multiprocessing import freeze_support
 from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from tap import Tap
@@ -63,16 +65,20 @@ def run_simulation(t_coherence: float, seed: int):
     return e2e_rate
 
 
-def run_row(n_runs: int, t_cohere: float) -> tuple[float, list[float]]:
-    rates: list[float] = []
-    for i in range(n_runs):
-        print(f"T_cohere={t_cohere:.4f}, run {i + 1}")
-        rate = run_simulation(t_cohere, SEED_BASE + i)
-        rates.append(rate)
-    return t_cohere, rates
+def run_task(task: tuple[float, int]) -> tuple[float, int, float]:
+    t_cohere, seed = task
+    print(f"T_cohere={t_cohere:.4f}, run {seed - SEED_BASE + 1}")
+    return t_cohere, seed, run_simulation(t_cohere, seed)
 
 
 def save_results(results: Any, *, save_csv: str | None, save_plt: str | None):
+    # imported here so that forked workers do not pay for matplotlib initialization
+    import matplotlib as mpl  # noqa: PLC0415
+
+    if save_plt:  # plot goes to a file, so skip initializing an interactive GUI backend
+        mpl.use("Agg")
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     # Final results summary print
     print("\nT_coh    Rate")
     for t, mean, std in zip(results["T_cohere"], results["Mean Rate"], results["Std Rate"]):
@@ -105,7 +111,8 @@ def save_results(results: Any, *, save_csv: str | None, save_plt: str | None):
     plt.tight_layout()
     if save_plt:
         plt.savefig(save_plt, dpi=300, transparent=True)
-    plt.show()
+    else:
+        plt.show()
 
 
 if __name__ == "__main__":
@@ -121,13 +128,20 @@ if __name__ == "__main__":
     args = Args().parse_args()
 
     # Simulator loop with process-based parallelism
-    with Pool(processes=args.workers) as pool:
-        rows = pool.starmap(run_row, itertools.product([args.runs], t_cohere_values))
-
-    results = {"T_cohere": [], "Mean Rate": [], "Std Rate": []}
-    for t_cohere, rates in rows:
-        results["T_cohere"].append(t_cohere)
-        results["Mean Rate"].append(np.mean(rates))
-        results["Std Rate"].append(np.std(rates))
+    # fork lets workers inherit already imported modules; it is unavailable on Windows, unsafe on macOS,
+    # and must not be used after the parent has started threads (e.g. a GUI backend).
+    # Elsewhere, fall back to the platform default start method.
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() and sys.platform != "darwin" else mp.get_context()
+    # one task per (t_cohere, seed), batched so that each IPC round trip carries several tasks
+    tasks = list(itertools.product(t_cohere_values, range(SEED_BASE, SEED_BASE + args.runs)))
+    chunksize = max(1, len(tasks) // (4 * args.workers))
+    rows = defaultdict[float, dict[int, float]](dict)
+    with ctx.Pool(processes=args.workers) as pool:
+        for t_cohere, seed, rate in pool.imap_unordered(run_task, tasks, chunksize=chunksize):
+            rows[t_cohere][seed] = rate
+
+    # rates[i][j] is the rate of t_cohere_values[i] with the j-th seed
+    rates = np.asarray([[rate for _, rate in sorted(rows[t_cohere].items())] for t_cohere in t_cohere_values])
+    results = {"T_cohere": t_cohere_values, "Mean Rate": rates.mean(axis=1), "Std Rate": rates.std(axis=1)}
 
     save_results(results, save_csv=args.csv, save_plt=args.plt)
@@ -1,10 +1,11 @@
 import itertools
 import json
-from multiprocessing import Pool, freeze_support
+import multiprocessing as mp
+import sys
+from collections import defaultdict
+from multiprocessing import freeze_support
 from typing import Any
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 from tap import Tap
 
@@ -68,32 +69,36 @@ def run_simulation(
     return e2e_rate, mean_fidelity
 
 
-def run_row(
-    n_runs: int, t_cohere: float, mem_alloc: tuple[int, int], arch: tuple[str, list[LinkArch]]
-) -> tuple[float, str, list[float], list[float]]:
+RowKey = tuple[float, tuple[int, int], str]
+"""(t_cohere, mem_alloc, arch_label)"""
+
+
+def run_task(task: tuple[float, tuple[int, int], str, int]) -> tuple[RowKey, int, float, float]:
+    t_cohere, mem_alloc, arch_label, seed = task
     left, right = mem_alloc
     total_qubits = left + right
-    arch_label, link_archs = arch
-
-    rates: list[float] = []
-    fids: list[float] = []
-    for i in range(n_runs):
-        print(f"{arch_label}, T_cohere={t_cohere:.3f}, Mem alloc={[left, right]}, run {i + 1}")
-        rate, fidelity = run_simulation(
-            nodes=["S", "R", "D"],
-            mem_capacities=[total_qubits, total_qubits, total_qubits],
-            ch_lengths=ch_lengths,
-            ch_capacities=[(total_qubits, left), (right, total_qubits)],
-            link_architectures=link_archs,
-            t_coherence=t_cohere,
-            seed=SEED_BASE + i,
-        )
-        rates.append(rate)
-        fids.append(fidelity)
-    return t_cohere, arch_label, rates, fids
+
+    print(f"{arch_label}, T_cohere={t_cohere:.3f}, Mem alloc={[left, right]}, run {seed - SEED_BASE + 1}")
+    rate, fidelity = run_simulation(
+        nodes=["S", "R", "D"],
+        mem_capacities=[total_qubits, total_qubits, total_qubits],
+        ch_lengths=ch_lengths,
+        ch_capacities=[(total_qubits, left), (right, total_qubits)],
+        link_architectures=channel_configs[arch_label],
+        t_coherence=t_cohere,
+        seed=seed,
+    )
+    return (t_cohere, mem_alloc, arch_label), seed, rate, fidelity
 
 
 def save_results(results: Any, *, save_json: str | None, save_plt: str | None):
+    # imported here so that forked workers do not pay for matplotlib initialization
+    import matplotlib as mpl  # noqa: PLC0415
+
+    if save_plt:  # plot goes to a file, so skip initializing an interactive GUI backend
+        mpl.use("Agg")
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
     if save_json:
         with open(save_json, "w") as file:
             json.dump(results, file)
@@ -148,7 +153,8 @@ def save_results(results: Any, *, save_json: str | None, save_plt: str | None):
     fig_combined.tight_layout(rect=(0, 0, 1, 0.95))
     if save_plt:
         plt.savefig(save_plt, dpi=300, transparent=True)
-    plt.show()
+    else:
+        plt.show()
 
 
 if __name__ == "__main__":
@@ -164,19 +170,32 @@ if __name__ == "__main__":
     args = Args().parse_args()
 
     # Simulator loop with process-based parallelism
-    with Pool(processes=args.workers) as pool:
-        rows = pool.starmap(run_row, itertools.product([args.runs], t_cohere_values, mem_allocs, channel_configs.items()))
+    # fork lets workers inherit already imported modules; it is unavailable on Windows, unsafe on macOS,
+    # and must not be used after the parent has started threads (e.g. a GUI backend).
+    # Elsewhere, fall back to the platform default start method.
+    ctx = mp.get_context("fork") if "fork" in mp.get_all_start_methods() and sys.platform != "darwin" else mp.get_context()
+    # one task per (t_cohere, mem_alloc, arch, seed), batched so that each IPC round trip carries several tasks
+    row_keys: list[RowKey] = list(itertools.product(t_cohere_values, mem_allocs, channel_configs.keys()))
+    tasks = [(*key, seed) for key in row_keys for seed in range(SEED_BASE, SEED_BASE + args.runs)]
+    chunksize = max(1, len(tasks) // (4 * args.workers))
+    rows = defaultdict[RowKey, dict[int, tuple[float, float]]](dict)
+    with ctx.Pool(processes=args.workers) as pool:
+        for key, seed, rate, fidelity in pool.imap_unordered(run_task, tasks, chunksize=chunksize):
+            rows[key][seed] = (rate, fidelity)
 
     # Store results: results[t_cohere][arch_label] = dict of lists
     results = {
         t: {arch_label: {"rate_mean": [], "rate_std": [], "fid_mean": [], "fid_std": []} for arch_label in channel_configs}
         for t in t_cohere_values
     }
-    for t_cohere, arch_label, rates, fids in rows:
+    # values[i][j] is the (rate, fidelity) of row_keys[i] with the j-th seed
+    values = np.asarray([[v for _, v in sorted(rows[key].items())] for key in row_keys])
+    means, stds = values.mean(axis=1).tolist(), values.std(axis=1).tolist()
+    for (t_cohere, _, arch_label), (rate_mean, fid_mean), (rate_std, fid_std) in zip(row_keys, means, stds):
         res = results[t_cohere][arch_label]
-        res["rate_mean"].append(np.mean(rates))
-        res["rate_std"].append(np.std(rates))
-        res["fid_mean"].append(np.mean(fids))
-        res["fid_std"].append(np.std(fids))
+        res["rate_mean"].append(rate_mean)
+        res["rate_std"].append(rate_std)
+        res["fid_mean"].append(fid_mean)
+        res["fid_std"].append(fid_std)
 
     save_results(results, save_json=args.json, save_plt=args.plt)
@@ -34,6 +34,8 @@ from mqns.entity.base_channel import BaseChannel, BaseChannelInitKwargs
 from mqns.entity.node import Node
 from mqns.simulator import Event, Time
 
+_UNDECODED = object()
+
 
 class ClassicPacket:
     """ClassicPacket is the message that transfer on a ClassicChannel"""
@@ -49,6 +51,8 @@ class ClassicPacket:
         self.is_json, self.msg = (False, msg) if isinstance(msg, (str, bytes)) else (True, json.dumps(msg))
         self.src = src
         self.dest = dest
+        self._decoded: Any = _UNDECODED
+        """Decoded JSON message, cached on first `get`."""
 
     def encode(self) -> bytes:
         """Encode the self.msg if it is a `str`
@@ -65,11 +69,18 @@ class ClassicPacket:
     def get(self) -> Any:
         """Get the message from packet
 
+        A JSON message is decoded once and the same object is returned to every caller,
+        such as each application that inspects the packet, so it must not be modified.
+
         Return:
             (Union[str, bytes, Any])
 
         """
-        return json.loads(self.msg) if self.is_json else self.msg
+        if not self.is_json:
+            return self.msg
+        if self._decoded is _UNDECODED:
+            self._decoded = json.loads(self.msg)
+        return self._decoded
 
     def __len__(self) -> int:
         return len(self.msg)
@@ -25,8 +25,10 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import bisect
+import heapq
 import itertools
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, overload
 
 from typing_extensions import Unpack, override
@@ -102,6 +104,16 @@ class QuantumMemory(Entity):
             (MemoryQubit(addr), None) for addr in range(self.capacity)
         ]
         self._usage = 0
+        self._channel_addrs: dict[str, list[int]] = {}
+        """
+        Addresses of qubits assigned to each qchannel, in ascending order.
+        Key is qchannel name.
+        """
+        self._name_addrs: dict[str, list[int]] = {}
+        """
+        Addresses of qubits holding a named quantum model, in ascending order.
+        Key is `QuantumModel.name`, which is not necessarily unique.
+        """
 
         self.pending_decohere_events: dict[str, Event] = {}
         """
@@ -139,30 +151,53 @@ class QuantumMemory(Entity):
 
     @overload
     def find(
-        self, predicate: Callable[[MemoryQubit, QuantumModel | None], bool]
+        self,
+        predicate: Callable[[MemoryQubit, QuantumModel | None], bool],
+        *,
+        qchannels: Iterable[str] | None = None,
     ) -> Iterator[tuple[MemoryQubit, QuantumModel | None]]:
         """
         Iterable over qubits and associated data that satisfy a predicate.
+
+        Args:
+            qchannels: If specified, only qubits assigned to these qchannels are considered.
         """
         pass
 
     @overload
     def find(
-        self, predicate: Callable[[MemoryQubit, BaseEntanglement], bool], *, has_epr: Literal[True]
+        self,
+        predicate: Callable[[MemoryQubit, BaseEntanglement], bool],
+        *,
+        has_epr: Literal[True],
+        qchannels: Iterable[str] | None = None,
     ) -> Iterator[tuple[MemoryQubit, BaseEntanglement]]:
         """
         Iterable over qubits and associated data that satisfy a predicate.
         Only qubits with associated entanglements are considered.
+
+        Args:
+            qchannels: If specified, only qubits assigned to these qchannels are considered.
         """
         pass
 
-    def find(self, predicate: Callable[[MemoryQubit, Any], bool], *, has_epr=False) -> Iterator[Any]:
-        for qubit, qm in self._storage:
+    def find(
+        self, predicate: Callable[[MemoryQubit, Any], bool], *, has_epr=False, qchannels: Iterable[str] | None = None
+    ) -> Iterator[Any]:
+        storage = self._storage if qchannels is None else self._iter_qchannels(qchannels)
+        for qubit, qm in storage:
             if has_epr and not isinstance(qm, BaseEntanglement):
                 continue
             if predicate(qubit, qm):
                 yield (qubit, qm)
 
+    def _iter_qchannels(self, ch_names: Iterable[str]) -> Iterator[tuple[MemoryQubit, QuantumModel | None]]:
+        """
+        Iterate over qubits assigned to any of the qchannels, in ascending address order.
+        """
+        for addr in heapq.merge(*(self._channel_addrs.get(ch_name, ()) for ch_name in ch_names)):
+            yield self._storage[addr]
+
     def assign(self, ch: "QuantumChannel", n=1) -> list[int]:
         """
         Assign n qubits to a particular quantum channel.
@@ -178,6 +213,7 @@ class QuantumMemory(Entity):
         addrs: list[int] = []
         for qubit, _ in itertools.islice(self.find(lambda q, _: q.qchannel is None), n):
             qubit.assign(ch)
+            bisect.insort(self._channel_addrs.setdefault(ch.name, []), qubit.addr)
             addrs.append(qubit.addr)
         if len(addrs) != n:
             raise OverflowError(f"{self}: insufficient qubits for assign(n={n})")
@@ -188,7 +224,10 @@ class QuantumMemory(Entity):
         Unassign one or more qubits from any quantum channel.
         """
         for addr in addrs:
-            self._storage[addr][0].unassign()
+            qubit = self._storage[addr][0]
+            if qubit.qchannel is not None:
+                self._channel_addrs[qubit.qchannel.name].remove(addr)
+            qubit.unassign()
 
     def allocate(self, path_id: int, path_direction: PathDirection, *, ch_name: str, n=1) -> list[int]:
         """
@@ -210,10 +249,7 @@ class QuantumMemory(Entity):
             OverflowError - insufficient unallocated qubits.
         """
         addrs: list[int] = []
-        for qubit, _ in itertools.islice(
-            self.find(lambda q, _: (q.path_id is None and (q.qchannel is not None and q.qchannel.name == ch_name))),
-            n,
-        ):
+        for qubit, _ in itertools.islice(self.find(lambda q, _: q.path_id is None, qchannels=(ch_name,)), n):
             qubit.allocate(path_id, path_direction)
             addrs.append(qubit.addr)
 
@@ -241,8 +277,8 @@ class QuantumMemory(Entity):
                 return qubit.addr
 
         if isinstance(key, str):
-            for qubit, _ in self.find(lambda _, v: getattr(v, "name", None) == key):
-                return qubit.addr
+            addrs = self._name_addrs.get(key)
+            return addrs[0] if addrs else -1
 
         return -1
 
@@ -338,6 +374,7 @@ class QuantumMemory(Entity):
         if destructive:
             self._usage -= 1
             self._storage[addr] = (qubit, None)
+            self._unindex_name(data, addr)
 
         if isinstance(data, BaseEntanglement):
             self._read_epr(data, destructive)
@@ -395,6 +432,7 @@ class QuantumMemory(Entity):
 
         self._storage[qubit.addr] = (qubit, qm)
         self._usage += 1
+        self._index_name(qm, qubit.addr)
 
         if isinstance(qm, BaseEntanglement) and qm.creation_time is not None and self.decoherence_delay:
             qm.decoherence_time = qm.creation_time + self.decoherence_delay
@@ -431,8 +469,10 @@ class QuantumMemory(Entity):
             assert old_event is None, f"decohere event not cleared for {old_qm}"
             return False
 
-        qubit = self._storage[addr][0]
+        qubit, old_data = self._storage[addr]
         self._storage[addr] = (qubit, new_qm)
+        self._unindex_name(old_data, addr)
+        self._index_name(new_qm, addr)
 
         old_event = self.pending_decohere_events.pop(old_qm)
         old_event.cancel()
@@ -448,6 +488,7 @@ class QuantumMemory(Entity):
             qubit.reset_state()
             self._storage[qubit.addr] = (qubit, None)
         self._usage = 0
+        self._name_addrs.clear()
 
         for event in self.pending_decohere_events.values():
             event.cancel()
@@ -467,7 +508,21 @@ class QuantumMemory(Entity):
             that are bound to the specified quantum channel.
 
         """
-        return list(self.find(lambda q, _: q.qchannel is not None and q.qchannel.name == ch_name))
+        return [self._storage[addr] for addr in self._channel_addrs.get(ch_name, ())]
+
+    def _index_name(self, qm: QuantumModel, addr: int) -> None:
+        name = getattr(qm, "name", None)
+        if name is not None:
+            bisect.insort(self._name_addrs.setdefault(name, []), addr)
+
+    def _unindex_name(self, qm: QuantumModel | None, addr: int) -> None:
+        name = getattr(qm, "name", None)
+        if name is None:
+            return
+        addrs = self._name_addrs[name]
+        addrs.remove(addr)
+        if not addrs:
+            del self._name_addrs[name]
 
     def _schedule_decohere(self, qubit: MemoryQubit, epr: BaseEntanglement):
         simulator = self.simulator
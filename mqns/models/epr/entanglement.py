@@ -80,8 +80,11 @@ class BaseEntanglement(ABC, Generic[EntanglementT]):
         """Index of this entanglement in a path, smaller indices are on the left side."""
         self.orig_eprs: list[EntanglementT] = []
         """Elementary entanglements that swapped into this entanglement."""
-        self.tmp_path_ids: frozenset[int] | None = None
-        """Possible path IDs, used by MuxSchemeStatistical and MuxSchemeDynamicEpr."""
+        self.tmp_path_ids: int | None = None
+        """
+        Possible path IDs, used by MuxSchemeStatistical and MuxSchemeDynamicEpr.
+        This is a bitmask where bit `i` is set if path_id `i` is possible.
+        """
 
     @property
     @abstractmethod
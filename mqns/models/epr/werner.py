@@ -206,5 +206,5 @@ class WernerStateEntanglement(BaseEntanglement["WernerStateEntanglement"], Quant
             f"orig_eprs={[e.name if hasattr(e, 'name') else repr(e) for e in self.orig_eprs]}), "
             f"creation_time={self.creation_time}, "
             f"decoherence_time={self.decoherence_time}), "
-            f"tmp_path_ids={self.tmp_path_ids})"
+            f"tmp_path_ids={None if self.tmp_path_ids is None else bin(self.tmp_path_ids)})"
         )
@@ -15,6 +15,8 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
+
 import numpy as np
 
 from mqns.models.qubit.typing import Basis, Operator1, Operator2, QubitState
@@ -37,23 +39,57 @@ OPERATOR_PAULI_X: Operator1 = np.array([[0, 1], [1, 0]], dtype=np.complex128)
 OPERATOR_PAULI_Y: Operator1 = np.array([[0, -1j], [1j, 0]], dtype=np.complex128)
 OPERATOR_PAULI_Z: Operator1 = np.array([[1, 0], [0, -1]], dtype=np.complex128)
 
+OPERATOR_PROJECTOR_0: Operator1 = np.array([[1, 0], [0, 0]], dtype=np.complex128)  # |0> <0|
+OPERATOR_PROJECTOR_1: Operator1 = np.array([[0, 0], [0, 1]], dtype=np.complex128)  # |1> <1|
 
-def OPERATOR_RX(theta: float) -> Operator1:
-    return np.array(
-        [[np.cos(theta / 2), -1j * np.sin(theta / 2)], [-1j * np.sin(theta / 2), np.cos(theta / 2)]], dtype=np.complex128
+
+def _readonly(operator: Operator1) -> Operator1:
+    operator.flags.writeable = False
+    return operator
+
+
+@functools.lru_cache(maxsize=128)
+def _operator_rx(theta: float) -> Operator1:
+    return _readonly(
+        np.array(
+            [[np.cos(theta / 2), -1j * np.sin(theta / 2)], [-1j * np.sin(theta / 2), np.cos(theta / 2)]], dtype=np.complex128
+        )
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _operator_ry(theta: float) -> Operator1:
+    return _readonly(
+        np.array([[np.cos(theta / 2), -np.sin(theta / 2)], [np.sin(theta / 2), np.cos(theta / 2)]], dtype=np.complex128)
     )
 
 
+@functools.lru_cache(maxsize=128)
+def _operator_rz(theta: float) -> Operator1:
+    return _readonly(np.array([[np.e ** (-0.5j * theta), 0], [0, np.e ** (0.5j * theta)]], dtype=np.complex128))
+
+
+@functools.lru_cache(maxsize=128)
+def _operator_phase_shift(theta: float) -> Operator1:
+    return _readonly(np.array([[1, 0], [0, np.e ** (1j * theta)]], dtype=np.complex128))
+
+
+# Rotation operators are cached per theta and shared between callers, so they are read-only.
+# theta is converted to float so that numpy scalars and 0-d arrays are accepted as cache keys.
+def OPERATOR_RX(theta: float) -> Operator1:
+    return _operator_rx(float(theta))
+
+
 def OPERATOR_RY(theta: float) -> Operator1:
-    return np.array([[np.cos(theta / 2), -np.sin(theta / 2)], [np.sin(theta / 2), np.cos(theta / 2)]], dtype=np.complex128)
+    return _operator_ry(float(theta))
 
 
 def OPERATOR_RZ(theta: float) -> Operator1:
-    return np.array([[np.e ** (-0.5j * theta), 0], [0, np.e ** (0.5j * theta)]], dtype=np.complex128)
+    return _operator_rz(float(theta))
 
 
 def OPERATOR_PHASE_SHIFT(theta: float) -> Operator1:
-    return np.array([[1, 0], [0, np.e ** (1j * theta)]], dtype=np.complex128)
+    return _operator_phase_shift(float(theta))
 
 
 OPERATOR_CNOT: Operator2 = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128)
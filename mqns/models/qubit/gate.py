@@ -27,6 +27,8 @@ from mqns.models.qubit.const import (
     OPERATOR_PAULI_Y,
     OPERATOR_PAULI_Z,
     OPERATOR_PHASE_SHIFT,
+    OPERATOR_PROJECTOR_0,
+    OPERATOR_PROJECTOR_1,
     OPERATOR_RX,
     OPERATOR_RY,
     OPERATOR_RZ,
@@ -34,7 +36,7 @@ from mqns.models.qubit.const import (
     OPERATOR_T,
 )
 from mqns.models.qubit.errors import QGateOperatorNotMatchError, QGateQubitNotInStateError
-from mqns.models.qubit.typing import Operator1
+from mqns.models.qubit.typing import Operator, Operator1
 from mqns.models.qubit.utils import joint, kron
 
 if TYPE_CHECKING:
@@ -156,6 +158,8 @@ class DoubleQubitsControlledGate(Gate):
         """
         super().__init__(name, _docs)
         self._operator = operator
+        self._full_operators: dict[tuple[int, int, int], Operator] = {}
+        """Read-only expanded operators of the default operator, keyed by (state.num, idx1, idx2)."""
 
     def __call__(self, qubit1: "Qubit", qubit2: "Qubit", operator: Operator1 | None = None) -> None:
         """Args:
@@ -185,21 +189,30 @@ class DoubleQubitsControlledGate(Gate):
         except ValueError:
             raise QGateQubitNotInStateError
 
+        if operator is not self._operator:
+            full_operator = self._expand(operator, state.num, idx1, idx2)
+        elif (full_operator := self._full_operators.get((state.num, idx1, idx2))) is None:
+            full_operator = self._expand(operator, state.num, idx1, idx2)
+            full_operator.setflags(write=False)
+            self._full_operators[(state.num, idx1, idx2)] = full_operator
+        qubit1.state.operate(full_operator)
+
+    @staticmethod
+    def _expand(operator: Operator1, num: int, idx1: int, idx2: int) -> Operator:
         full_operator_part_0 = np.array([1])  # |0> <0|
         full_operator_part_1 = np.array([1])  # |1> <1|
 
-        for i in range(state.num):
+        for i in range(num):
             if i == idx1:
-                full_operator_part_0 = kron(full_operator_part_0, np.array([[1, 0], [0, 0]]))
-                full_operator_part_1 = kron(full_operator_part_1, np.array([[0, 0], [0, 1]]))
+                full_operator_part_0 = kron(full_operator_part_0, OPERATOR_PROJECTOR_0)
+                full_operator_part_1 = kron(full_operator_part_1, OPERATOR_PROJECTOR_1)
             elif i == idx2:
                 full_operator_part_0 = kron(full_operator_part_0, OPERATOR_PAULI_I)
                 full_operator_part_1 = kron(full_operator_part_1, operator)
             else:
                 full_operator_part_0 = kron(full_operator_part_0, OPERATOR_PAULI_I)
                 full_operator_part_1 = kron(full_operator_part_1, OPERATOR_PAULI_I)
-        full_operator = full_operator_part_0 + full_operator_part_1
-        qubit1.state.operate(full_operator)
+        return full_operator_part_0 + full_operator_part_1
 
 
 ControlledGate = DoubleQubitsControlledGate(name="Controlled Gate", operator=OPERATOR_PAULI_X, _docs="The controlled gate")
@@ -276,6 +289,8 @@ class ThreeQubitsGate(Gate):
         """
         super().__init__(name, _docs)
         self._operator = operator
+        self._full_operators: dict[tuple[int, int, int, int], Operator] = {}
+        """Read-only expanded operators of the default operator, keyed by (state.num, idx1, idx2, idx3)."""
 
     def __call__(self, qubit1: "Qubit", qubit2: "Qubit", qubit3: "Qubit", operator: Operator1 | None = None) -> Any:
         if operator is None:
@@ -298,22 +313,32 @@ class ThreeQubitsGate(Gate):
         except ValueError:
             raise QGateQubitNotInStateError
 
+        if operator is not self._operator:
+            full_operator = self._expand(operator, state.num, idx1, idx2, idx3)
+        elif (full_operator := self._full_operators.get((state.num, idx1, idx2, idx3))) is None:
+            full_operator = self._expand(operator, state.num, idx1, idx2, idx3)
+            full_operator.setflags(write=False)
+            self._full_operators[(state.num, idx1, idx2, idx3)] = full_operator
+        qubit1.state.operate(full_operator)
+
+    @staticmethod
+    def _expand(operator: Operator1, num: int, idx1: int, idx2: int, idx3: int) -> Operator:
         full_operator_part_00 = np.array([1])  # |0> <0|
         full_operator_part_01 = np.array([1])  # |1> <1|
         full_operator_part_10 = np.array([1])  # |0> <0|
         full_operator_part_11 = np.array([1])  # |1> <1|
 
-        for i in range(state.num):
+        for i in range(num):
             if i == idx1:
-                full_operator_part_00 = kron(full_operator_part_00, np.array([[1, 0], [0, 0]]))
-                full_operator_part_01 = kron(full_operator_part_01, np.array([[1, 0], [0, 0]]))
-                full_operator_part_10 = kron(full_operator_part_10, np.array([[0, 0], [0, 1]]))
-                full_operator_part_11 = kron(full_operator_part_11, np.array([[0, 0], [0, 1]]))
+                full_operator_part_00 = kron(full_operator_part_00, OPERATOR_PROJECTOR_0)
+                full_operator_part_01 = kron(full_operator_part_01, OPERATOR_PROJECTOR_0)
+                full_operator_part_10 = kron(full_operator_part_10, OPERATOR_PROJECTOR_1)
+                full_operator_part_11 = kron(full_operator_part_11, OPERATOR_PROJECTOR_1)
             elif i == idx2:
-                full_operator_part_00 = kron(full_operator_part_00, np.array([[1, 0], [0, 0]]))
-                full_operator_part_10 = kron(full_operator_part_10, np.array([[1, 0], [0, 0]]))
-                full_operator_part_01 = kron(full_operator_part_01, np.array([[0, 0], [0, 1]]))
-                full_operator_part_11 = kron(full_operator_part_11, np.array([[0, 0], [0, 1]]))
+                full_operator_part_00 = kron(full_operator_part_00, OPERATOR_PROJECTOR_0)
+                full_operator_part_10 = kron(full_operator_part_10, OPERATOR_PROJECTOR_0)
+                full_operator_part_01 = kron(full_operator_part_01, OPERATOR_PROJECTOR_1)
+                full_operator_part_11 = kron(full_operator_part_11, OPERATOR_PROJECTOR_1)
             elif i == idx3:
                 full_operator_part_00 = kron(full_operator_part_00, OPERATOR_PAULI_I)
                 full_operator_part_01 = kron(full_operator_part_01, OPERATOR_PAULI_I)
@@ -324,8 +349,7 @@ class ThreeQubitsGate(Gate):
                 full_operator_part_01 = kron(full_operator_part_01, OPERATOR_PAULI_I)
                 full_operator_part_10 = kron(full_operator_part_10, OPERATOR_PAULI_I)
                 full_operator_part_11 = kron(full_operator_part_11, OPERATOR_PAULI_I)
-        full_operator = full_operator_part_00 + full_operator_part_01 + full_operator_part_10 + full_operator_part_11
-        qubit1.state.operate(full_operator)
+        return full_operator_part_00 + full_operator_part_01 + full_operator_part_10 + full_operator_part_11
 
 
 Toffoli = ThreeQubitsGate(name="Toffoli Gate", operator=OPERATOR_PAULI_X, _docs="The controlled-controlled (Toffoli) gate")
@@ -21,6 +21,9 @@ import numpy as np
 
 from mqns.models.core import QuantumModel
 from mqns.models.qubit.const import (
+    OPERATOR_PAULI_I,
+    OPERATOR_PROJECTOR_0,
+    OPERATOR_PROJECTOR_1,
     QUBIT_STATE_0,
     QUBIT_STATE_1,
     QUBIT_STATE_L,
@@ -86,8 +89,8 @@ class QState:
         S_0 = None
         S_1 = None
         if base == "Z":
-            M_0 = np.array([[1, 0], [0, 0]])
-            M_1 = np.array([[0, 0], [0, 1]])
+            M_0 = OPERATOR_PROJECTOR_0
+            M_1 = OPERATOR_PROJECTOR_1
             S_0 = QUBIT_STATE_0
             S_1 = QUBIT_STATE_1
         elif base == "X":
@@ -117,8 +120,8 @@ class QState:
                 Full_M_0 = kron(Full_M_0, M_0)
                 Full_M_1 = kron(Full_M_1, M_1)
             else:
-                Full_M_0 = kron(Full_M_0, np.array([[1, 0], [0, 1]]))
-                Full_M_1 = kron(Full_M_1, np.array([[1, 0], [0, 1]]))
+                Full_M_0 = kron(Full_M_0, OPERATOR_PAULI_I)
+                Full_M_1 = kron(Full_M_1, OPERATOR_PAULI_I)
 
         poss_0 = np.trace(np.dot(Full_M_0.T.conjugate(), np.dot(Full_M_0, self.rho)))
         rn = get_rand()
@@ -5,7 +5,7 @@ from mqns.entity.node import QNode
 from mqns.models.epr import WernerStateEntanglement
 from mqns.network.proactive.fib import FibEntry
 from mqns.network.proactive.mux_buffer_space import MuxSchemeFibBase
-from mqns.network.proactive.mux_statistical import MuxSchemeDynamicBase, has_intersect_tmp_path_ids
+from mqns.network.proactive.mux_statistical import MuxSchemeDynamicBase, has_intersect_tmp_path_ids, iter_tmp_path_ids
 from mqns.network.proactive.select import SelectPath, select_path_random
 from mqns.utils import log
 
@@ -40,14 +40,15 @@ class MuxSchemeDynamicEpr(MuxSchemeDynamicBase, MuxSchemeFibBase):
             # The necessary information could be carried in the reservation message.
             # For ease of implementation, this choice is made at either primary or secondary node,
             # whichever receives the EPR notification earlier.
-            fib_entries = [self.fib.get(pid) for pid in possible_path_ids]
+            fib_entries = [self.fib.get(pid) for pid in iter_tmp_path_ids(possible_path_ids)]
             fib_entry = self.select_path(fib_entries)
-            epr.tmp_path_ids = frozenset([fib_entry.path_id])
+            epr.tmp_path_ids = 1 << fib_entry.path_id
         else:
-            assert len(epr.tmp_path_ids) == 1
-            fib_entry = self.fib.get(next(epr.tmp_path_ids.__iter__()))
+            assert epr.tmp_path_ids.bit_count() == 1
+            fib_entry = self.fib.get(epr.tmp_path_ids.bit_length() - 1)
 
-        log.debug(f"{self.own}: qubit {qubit} has selected path_id {fib_entry.path_id}")
+        if log.debug_enabled():
+            log.debug(f"{self.own}: qubit {qubit} has selected path_id {fib_entry.path_id}")
 
         qubit.state = QubitState.PURIF
         self.fw.qubit_is_purif(qubit, fib_entry, neighbor)
@@ -55,7 +56,7 @@ class MuxSchemeDynamicEpr(MuxSchemeDynamicBase, MuxSchemeFibBase):
     @override
     def list_swap_candidates(self, mq0: MemoryQubit, fib_entry: FibEntry):
         assert mq0.path_id is None
-        possible_path_ids = [fib_entry.path_id]
+        possible_path_ids = 1 << fib_entry.path_id
         return self.memory.find(
             lambda q, v: q.state == QubitState.ELIGIBLE  # in ELIGIBLE state
             and q.qchannel != mq0.qchannel  # assigned to a different channel
@@ -78,7 +79,7 @@ class MuxSchemeDynamicEpr(MuxSchemeDynamicBase, MuxSchemeFibBase):
     @override
     def su_parallel_has_conflict(self, my_new_epr: WernerStateEntanglement, su_path_id: int) -> bool:
         assert my_new_epr.tmp_path_ids is not None
-        if su_path_id not in my_new_epr.tmp_path_ids:
+        if not (my_new_epr.tmp_path_ids >> su_path_id) & 1:
             raise Exception(f"{self.own}: Unexpected conflictual parallel swapping")
         return False
 
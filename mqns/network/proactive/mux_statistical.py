@@ -1,6 +1,4 @@
-import random
-from collections import defaultdict
-from collections.abc import Iterable, Set
+from collections.abc import Iterator
 
 from typing_extensions import override
 
@@ -13,32 +11,72 @@ from mqns.network.proactive.message import PathInstructions, validate_path_instr
 from mqns.network.proactive.mux import MuxScheme
 from mqns.network.proactive.select import select_swap_qubit
 from mqns.utils import log
+from mqns.utils.rnd import rng
 
 
-def has_intersect_tmp_path_ids(epr0: Set[int] | None, epr1: Iterable[int] | None) -> bool:
+def iter_tmp_path_ids(path_ids: int) -> Iterator[int]:
     """
-    Determine whether at least one path_id overlaps between tmp_path_ids sets in two EPRs.
+    Iterate over path_ids in a tmp_path_ids bitmask, in ascending order.
     """
-    return epr0 is not None and epr1 is not None and not epr0.isdisjoint(epr1)
+    while path_ids:
+        lowest = path_ids & -path_ids
+        yield lowest.bit_length() - 1
+        path_ids ^= lowest
 
 
-def intersect_tmp_path_ids(epr0: BaseEntanglement, epr1: BaseEntanglement) -> frozenset[int]:
+def choose_tmp_path_id(path_ids: int) -> int:
     """
-    Find overlapping path_ids between tmp_path_ids sets in two EPRs.
+    Choose a path_id uniformly at random from a non-empty tmp_path_ids bitmask.
+
+    Candidates are indexed in ascending path_id order, so this consumes random numbers the same way as
+    `rng.choice(list(iter_tmp_path_ids(path_ids)))`.
+    This is not bit-compatible with choosing from a frozenset of path_ids, whose iteration order differs.
+
+    Raises:
+        ValueError - empty bitmask.
+    """
+    for _ in range(rng.randrange(path_ids.bit_count())):
+        path_ids &= path_ids - 1  # clear lowest set bit
+    return (path_ids & -path_ids).bit_length() - 1
+
+
+def has_intersect_tmp_path_ids(epr0: int | None, epr1: int | None) -> bool:
+    """
+    Determine whether at least one path_id overlaps between tmp_path_ids bitmasks in two EPRs.
+    """
+    return epr0 is not None and epr1 is not None and (epr0 & epr1) != 0
+
+
+def intersect_tmp_path_ids(epr0: BaseEntanglement, epr1: BaseEntanglement) -> int:
+    """
+    Find overlapping path_ids between tmp_path_ids bitmasks in two EPRs.
     """
     assert epr0.tmp_path_ids is not None
     assert epr1.tmp_path_ids is not None
-    path_ids = epr0.tmp_path_ids.intersection(epr1.tmp_path_ids)
+    path_ids = epr0.tmp_path_ids & epr1.tmp_path_ids
     if not path_ids:
-        raise Exception(f"Cannot select path ID from {epr0.tmp_path_ids} and {epr1.tmp_path_ids}")
+        raise Exception(
+            f"Cannot select path ID from {list(iter_tmp_path_ids(epr0.tmp_path_ids))} "
+            f"and {list(iter_tmp_path_ids(epr1.tmp_path_ids))}"
+        )
     return path_ids
 
 
 class MuxSchemeDynamicBase(MuxScheme):
     def __init__(self, name: str):
         super().__init__(name)
-        self.qchannel_paths_map = defaultdict[str, list[int]](lambda: [])
-        """stores path-qchannel relationship"""
+        self.qchannel_paths_map: dict[str, int] = {}
+        """
+        stores path-qchannel relationship.
+
+        Each value is a bitmask of path_ids in the same format as `epr.tmp_path_ids`.
+        """
+        self._matched_channels_cache: dict[tuple[int, str], frozenset[str]] = {}
+        """
+        Cache of `_find_matched_channels` results, cleared by `_clear_caches` whenever paths change.
+        Key is tmp_path_ids and the qchannel name of the qubit.
+        Value is the names of other qchannels that have overlapping path_ids.
+        """
 
     @override
     def validate_path_instructions(self, instructions: PathInstructions):
@@ -57,7 +95,8 @@ class MuxSchemeDynamicBase(MuxScheme):
         _ = instructions
         _ = direction
         _ = neighbor
-        self.qchannel_paths_map[qchannel.name].append(fib_entry.path_id)
+        self.qchannel_paths_map[qchannel.name] = self.qchannel_paths_map.get(qchannel.name, 0) | (1 << fib_entry.path_id)
+        self._clear_caches()
 
     @override
     def uninstall_path_neighbor(
@@ -70,25 +109,52 @@ class MuxSchemeDynamicBase(MuxScheme):
         _ = direction
         _ = neighbor
         paths = self.qchannel_paths_map[qchannel.name]
-        paths.remove(fib_entry.path_id)
-        if len(paths) == 0:
+        assert (paths >> fib_entry.path_id) & 1
+        paths &= ~(1 << fib_entry.path_id)
+        if paths == 0:
             del self.qchannel_paths_map[qchannel.name]
+        else:
+            self.qchannel_paths_map[qchannel.name] = paths
+        self._clear_caches()
+
+    def _clear_caches(self) -> None:
+        """
+        Clear cached information derived from `qchannel_paths_map` and FIB entries.
+        This is invoked whenever a path is installed or uninstalled.
+        """
+        self._matched_channels_cache.clear()
 
     @override
     def qubit_has_path_id(self) -> bool:
         return False
 
-    def _qubit_is_entangled_0(self, qubit: MemoryQubit) -> list[int]:
+    def _qubit_is_entangled_0(self, qubit: MemoryQubit) -> int:
         assert qubit.path_id is None
         assert qubit.qchannel is not None, f"{self.own}: No qubit-qchannel assignment. Not supported."
 
-        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel.name, [])
+        possible_path_ids = self.qchannel_paths_map.get(qubit.qchannel.name, 0)
         if not possible_path_ids:
-            log.debug(f"{self.own}: release entangled qubit {qubit.addr} due to uninstalled path")
+            if log.debug_enabled():
+                log.debug(f"{self.own}: release entangled qubit {qubit.addr} due to uninstalled path")
             self.fw.release_qubit(qubit, read=True)
 
         return possible_path_ids
 
+    def _find_matched_channels(self, tmp_path_ids: int, qchannel_name: str) -> frozenset[str]:
+        """
+        Find qchannels whose qubits may be swapped with a qubit on `qchannel_name` having `tmp_path_ids`.
+        The qubit's own qchannel is excluded.
+        """
+        key = (tmp_path_ids, qchannel_name)
+        matched = self._matched_channels_cache.get(key)
+        if matched is None:
+            matched = self._matched_channels_cache[key] = frozenset(
+                channel
+                for channel, path_ids in self.qchannel_paths_map.items()
+                if channel != qchannel_name and (tmp_path_ids & path_ids) != 0
+            )
+        return matched
+
 
 class MuxSchemeStatistical(MuxSchemeDynamicBase):
     """
@@ -112,6 +178,17 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         """
         super().__init__(name)
         self.coordinated_decisions = coordinated_decisions
+        self._rank_diff_cache: dict[tuple[int, str], int] = {}
+        """
+        Cache of `_calc_rank_diff` results, cleared by `_clear_caches` whenever paths change.
+        Key is path_id and neighbor node name.
+        Value is own swapping rank minus neighbor swapping rank.
+        """
+
+    @override
+    def _clear_caches(self) -> None:
+        super()._clear_caches()
+        self._rank_diff_cache.clear()
 
     @override
     def validate_path_instructions(self, instructions: PathInstructions):
@@ -128,18 +205,19 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
     @override
     def qubit_is_entangled(self, qubit: MemoryQubit, neighbor: QNode) -> None:
         _ = neighbor
-        possible_path_ids = frozenset(self._qubit_is_entangled_0(qubit))
+        possible_path_ids = self._qubit_is_entangled_0(qubit)
         if not possible_path_ids:  # all paths on the channel have been uninstalled
             return
 
         _, epr = self.memory.get(qubit.addr, must=True)
         assert isinstance(epr, WernerStateEntanglement)
 
-        log.debug(f"{self.own}: qubit {qubit} has tmp_path_ids {possible_path_ids}")
+        if log.debug_enabled():
+            log.debug(f"{self.own}: qubit {qubit} has tmp_path_ids {list(iter_tmp_path_ids(possible_path_ids))}")
         if epr.tmp_path_ids is None:
             epr.tmp_path_ids = possible_path_ids
         elif self.coordinated_decisions:
-            assert epr.tmp_path_ids.issubset(possible_path_ids)
+            assert (epr.tmp_path_ids & ~possible_path_ids) == 0
         else:
             # Assuming both primary and secondary nodes in an elementary EPR have the same path instructions,
             # both nodes should have the same qchannel_paths_map and thus derive the same tmp_path_ids.
@@ -149,34 +227,38 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
             qubit.state = QubitState.PURIF
 
             # purif scheme is empty, as checked in validate_path_instructions
-            log.debug(f"{self.own}: no FIB associated to qubit -> set eligible")
+            if log.debug_enabled():
+                log.debug(f"{self.own}: no FIB associated to qubit -> set eligible")
             qubit.state = QubitState.ELIGIBLE
             self.fw.qubit_is_eligible(qubit, None)
 
-    def _can_enter_purif(self, epr: WernerStateEntanglement, neighbor: QNode) -> bool:
-        def calc_rank_diff(path_id: int):
+    def _calc_rank_diff(self, path_id: int, neighbor_name: str) -> int:
+        key = (path_id, neighbor_name)
+        rank_diff = self._rank_diff_cache.get(key)
+        if rank_diff is None:
             fib_entry = self.fib.get(path_id)
-            _, p_rank = fib_entry.find_index_and_swap_rank(neighbor.name)
-            return fib_entry.own_swap_rank - p_rank
+            _, p_rank = fib_entry.find_index_and_swap_rank(neighbor_name)
+            rank_diff = self._rank_diff_cache[key] = fib_entry.own_swap_rank - p_rank
+        return rank_diff
 
+    def _can_enter_purif(self, epr: WernerStateEntanglement, neighbor: QNode) -> bool:
         assert epr.tmp_path_ids is not None
-        rank_diff = [calc_rank_diff(path_id) for path_id in epr.tmp_path_ids]
-        assert min(rank_diff) == max(rank_diff)  # failure means one route is a substring of another route, unsupported
-        return rank_diff[0] <= 0
+        path_ids = iter_tmp_path_ids(epr.tmp_path_ids)
+        rank_diff = self._calc_rank_diff(next(path_ids), neighbor.name)
+        # failure means one route is a substring of another route, unsupported
+        assert all(self._calc_rank_diff(path_id, neighbor.name) == rank_diff for path_id in path_ids)
+        return rank_diff <= 0
 
     @override
     def find_swap_candidate(
         self, qubit: MemoryQubit, epr: WernerStateEntanglement, fib_entry: FibEntry | None
     ) -> tuple[MemoryQubit, FibEntry] | None:
         assert qubit.qchannel is not None
+        assert epr.tmp_path_ids is not None
 
         # find qchannels whose qubits may be used with this qubit
         # use path_ids to look for acceptable qchannels for swapping, excluding the qubit's qchannel
-        matched_channels = {
-            channel
-            for channel, path_ids in self.qchannel_paths_map.items()
-            if channel != qubit.qchannel.name and has_intersect_tmp_path_ids(epr.tmp_path_ids, path_ids)
-        }
+        matched_channels = self._find_matched_channels(epr.tmp_path_ids, qubit.qchannel.name)
 
         # find another qubit to swap with
         found = select_swap_qubit(
@@ -186,9 +268,9 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
             fib_entry,
             self.memory.find(
                 lambda q, v: q.state == QubitState.ELIGIBLE  # in ELIGIBLE state
-                and (q.qchannel is not None and q.qchannel.name in matched_channels)  # assigned to a matched channel
                 and has_intersect_tmp_path_ids(epr.tmp_path_ids, v.tmp_path_ids),  # has overlapping tmp_path_ids
                 has_epr=True,
+                qchannels=matched_channels,  # assigned to a matched channel
             ),
         )
         # TODO selection algorithm among found qubits
@@ -197,9 +279,9 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
         mq1, epr1 = found
         assert isinstance(epr1, WernerStateEntanglement)
 
-        chosen_path_id = random.choice(list(intersect_tmp_path_ids(epr, epr1)))
+        chosen_path_id = choose_tmp_path_id(intersect_tmp_path_ids(epr, epr1))
         if self.coordinated_decisions:
-            epr.tmp_path_ids = epr1.tmp_path_ids = frozenset([chosen_path_id])
+            epr.tmp_path_ids = epr1.tmp_path_ids = 1 << chosen_path_id
         fib_entry = self.fib.get(chosen_path_id)
         return mq1, fib_entry
 
@@ -215,9 +297,10 @@ class MuxSchemeStatistical(MuxSchemeDynamicBase):
     @override
     def su_parallel_has_conflict(self, my_new_epr: WernerStateEntanglement, su_path_id: int) -> bool:
         assert my_new_epr.tmp_path_ids is not None
-        if su_path_id not in my_new_epr.tmp_path_ids:
+        if not (my_new_epr.tmp_path_ids >> su_path_id) & 1:
             assert not self.coordinated_decisions
-            log.debug(f"{self.own}: Conflictual parallel swapping in statistical mux -> silently ignore")
+            if log.debug_enabled():
+                log.debug(f"{self.own}: Conflictual parallel swapping in statistical mux -> silently ignore")
             return True
         return False
 
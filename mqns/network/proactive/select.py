@@ -1,4 +1,3 @@
-import random
 from collections.abc import Callable, Iterator
 from typing import cast
 
@@ -6,6 +5,7 @@ from mqns.entity.memory import MemoryQubit
 from mqns.entity.node import QNode
 from mqns.models.epr import BaseEntanglement, WernerStateEntanglement
 from mqns.network.proactive.fib import FibEntry
+from mqns.utils.rnd import rng
 
 SelectPurifQubit = (
     Callable[
@@ -43,7 +43,7 @@ def select_purif_qubit_random(
     candidates: list[tuple[MemoryQubit, WernerStateEntanglement]],
 ) -> tuple[MemoryQubit, WernerStateEntanglement]:
     _ = qubit, fib_entry, partner
-    return random.choice(candidates)
+    return rng.choice(candidates)
 
 
 SelectSwapQubit = (
@@ -82,7 +82,7 @@ def select_swap_qubit_random(
     candidates: list[tuple[MemoryQubit, WernerStateEntanglement]],
 ) -> tuple[MemoryQubit, WernerStateEntanglement]:
     _ = qubit, epr, fib_entry
-    return random.choice(candidates)
+    return rng.choice(candidates)
 
 
 SelectPath = Callable[[list[FibEntry]], FibEntry]
@@ -95,7 +95,7 @@ def select_path_random(fibs: list[FibEntry]) -> FibEntry:
     """
     Path selection strategy: random allocation.
     """
-    return random.choice(fibs)
+    return rng.choice(fibs)
 
 
 def select_path_swap_weighted(fibs: list[FibEntry]) -> FibEntry:
@@ -104,4 +104,4 @@ def select_path_swap_weighted(fibs: list[FibEntry]) -> FibEntry:
     """
     # Lower swaps = higher weight
     weights = [1.0 / (1 + len(e.swap)) for e in fibs]
-    return random.choices(fibs, weights=weights, k=1)[0]
+    return rng.choices(fibs, weights=weights, k=1)[0]
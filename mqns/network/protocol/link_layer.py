@@ -15,7 +15,6 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import uuid
 from collections import deque
 from dataclasses import dataclass
 from typing import Literal, TypedDict, cast
@@ -28,7 +27,7 @@ from mqns.entity.memory import MemoryQubit, QuantumMemory, QubitState
 from mqns.entity.node import Application, Node, QNode
 from mqns.entity.qchannel import QuantumChannel
 from mqns.models.epr import WernerStateEntanglement
-from mqns.network.network import TimingPhase, TimingPhaseEvent
+from mqns.network.network import TimingMode, TimingPhase, TimingPhaseEvent
 from mqns.network.protocol.event import (
     LinkArchSuccessEvent,
     ManageActiveChannels,
@@ -108,6 +107,10 @@ class LinkLayer(Application):
         """Quantum node that owns this LinkLayer."""
         self.memory: QuantumMemory
         """Quantum memory of the node."""
+        self.timing: TimingMode
+        """Network-wide application timing mode, which does not change after installation."""
+        self._is_async: bool
+        """Whether `timing` is ASYNC."""
 
         self.active_channels = dict[tuple[QuantumChannel, int | None], tuple[QNode, int]]()
         """
@@ -133,6 +136,23 @@ class LinkLayer(Application):
         """
         FIFO queue of reservation requests awaiting for memory qubits.
         """
+        self._cchannels: dict[QNode, ClassicChannel] = {}
+        """
+        Cache of classic channels to neighbor nodes, populated on first use.
+        Channels cannot be added after installation, so entries never become stale.
+        """
+        self._qchannels: dict[QNode, QuantumChannel] = {}
+        """
+        Cache of quantum channels to neighbor nodes, populated on first use.
+        """
+        self._success_probs: dict[QuantumChannel, float] = {}
+        """
+        Cache of single attempt success probability on each quantum channel, populated on first use.
+        It depends only on the qchannel and the hardware parameters above, which are fixed.
+        """
+
+        self._name_seq = 0
+        """Sequence number for reservation keys and EPR names, see `_next_name`."""
 
         self.etg_count = 0
         """Counter of generated entanglements."""
@@ -151,6 +171,21 @@ class LinkLayer(Application):
         super().install(node, simulator)
         self.own = self.get_node(node_type=QNode)
         self.memory = self.own.get_memory()
+        self.timing = self.own.timing
+        self._is_async = self.timing.is_async()
+        assert "#" not in self.own.name, "node name must not contain '#', it separates the sequence number in `_next_name`"
+
+    def _next_name(self) -> str:
+        """
+        Generate a reservation key or EPR name that is unique within the network.
+
+        Node names are unique within the network, so prefixing a per-node sequence number
+        avoids the cost of a random UUID per entanglement attempt.
+        The '#' separator cannot appear in node names, so names stay unambiguous even when
+        node names contain '-' and several names are joined by `_name_hash`.
+        """
+        self._name_seq += 1
+        return f"{self.own.name}#{self._name_seq}"
 
     def handle_sync_phase(self, event: TimingPhaseEvent):
         """
@@ -203,7 +238,7 @@ class LinkLayer(Application):
 
         log.debug(f"{self.own}: add qchannel {qchannel} with {neighbor} on path {path_id}, link arch {qchannel.link_arch.name}")
 
-        if self.own.timing.is_async():
+        if self._is_async:
             self.run_active_channel(qchannel, path_id, neighbor)
 
     def remove_active_channel(self, qchannel: QuantumChannel, path_id: int | None, neighbor: QNode):
@@ -233,7 +268,8 @@ class LinkLayer(Application):
 
         """
         qubits = self.memory.get_channel_qubits(ch_name=qchannel.name)
-        log.debug(f"{self.own}: {qchannel.name} has assigned qubits: {qubits}")
+        if log.debug_enabled():
+            log.debug(f"{self.own}: {qchannel.name} has assigned qubits: {qubits}")
         for qb, data in qubits:
             if qb.path_id != path_id or qb.state != QubitState.RAW:
                 continue
@@ -246,7 +282,7 @@ class LinkLayer(Application):
         Start the exchange with neighbor node for reserving a qubit for entanglement
         generation over a specified quantum channel. It performs the following steps:
 
-        1. Construct a random reservation `key`.
+        1. Construct a unique reservation `key`.
         2. Mark the qubit as active using the reservation key.
         3. Store reservation metadata in `pending_init_reservation`.
         4. Send a classical message to the next hop to request qubit reservation.
@@ -262,19 +298,18 @@ class LinkLayer(Application):
 
         Notes:
             - The `key` uniquely identifies the reservation context.
-              Key format: `<node1>_<node2>_[<path_id>]_<local_qubit_addr>`
+              Key format: `<own node name>-<sequence number>`
             - The reservation is communicated via a classical message using the `RESERVE_QUBIT` command.
         """
 
-        key = uuid.uuid4().hex
+        key = self._next_name()
         assert key not in self.pending_init_reservation
         qubit.state, qubit.active = QubitState.ACTIVE, key
         self.pending_init_reservation[key] = (qchannel, next_hop, qubit)
         log.debug(f"{self.own}: start reservation key={key} dst={next_hop} addr={qubit.addr} path={qubit.path_id}")
 
         msg: ReserveMsg = {"cmd": "RESERVE_QUBIT", "path_id": qubit.path_id, "key": key}
-        cchannel = self.own.get_cchannel(next_hop)
-        cchannel.send(ClassicPacket(msg, src=self.own, dest=next_hop), next_hop=next_hop)
+        self._get_cchannel(next_hop).send(ClassicPacket(msg, src=self.own, dest=next_hop), next_hop=next_hop)
 
     def handle_reserve_req(self, msg: ReserveMsg, cchannel: ClassicChannel):
         """
@@ -286,11 +321,23 @@ class LinkLayer(Application):
         """
         from_node = cchannel.find_peer(self.own)
         assert isinstance(from_node, QNode)
-        qchannel = self.own.get_qchannel(from_node)
+        qchannel = self._get_qchannel(from_node)
         req = ReservationRequest(msg["key"], msg["path_id"], cchannel, from_node, qchannel)
         if not self.try_accept_reservation(req):
             self.fifo_reservation_req.append(req)
 
+    def _get_cchannel(self, neighbor: QNode) -> ClassicChannel:
+        cchannel = self._cchannels.get(neighbor)
+        if cchannel is None:
+            cchannel = self._cchannels[neighbor] = self.own.get_cchannel(neighbor)
+        return cchannel
+
+    def _get_qchannel(self, neighbor: QNode) -> QuantumChannel:
+        qchannel = self._qchannels.get(neighbor)
+        if qchannel is None:
+            qchannel = self._qchannels[neighbor] = self.own.get_qchannel(neighbor)
+        return qchannel
+
     def try_accept_reservation(self, req: ReservationRequest) -> bool:
         """
         Accept a reservation if a qubit is available.
@@ -305,8 +352,8 @@ class LinkLayer(Application):
             self.memory.find(
                 lambda q, v: v is None  # currently unoccupied
                 and not q.active  # not part of an active reservation
-                and q.qchannel == req.qchannel  # assigned to the quantum channel
-                and q.path_id == req.path_id  # allocated to the path_id, if MuxScheme uses path_id
+                and q.path_id == req.path_id,  # allocated to the path_id, if MuxScheme uses path_id
+                qchannels=(req.qchannel.name,),  # assigned to the quantum channel
             ),
             (None, None),
         )
@@ -344,9 +391,11 @@ class LinkLayer(Application):
         simulator = self.simulator
 
         # Calculate which attempt would succeed.
-        p = qchannel.link_arch.success_prob(
-            length=qchannel.length, alpha=self.alpha_db_per_km, eta_s=self.eta_s, eta_d=self.eta_d
-        )
+        p = self._success_probs.get(qchannel)
+        if p is None:
+            p = self._success_probs[qchannel] = qchannel.link_arch.success_prob(
+                length=qchannel.length, alpha=self.alpha_db_per_km, eta_s=self.eta_s, eta_d=self.eta_d
+            )
         k = np.random.geometric(p)
 
         # Calculate when would the k-th attempt (1-based) succeed.
@@ -361,7 +410,7 @@ class LinkLayer(Application):
         t_notify_a = simulator.tc + (d_epr_creation + d_notify_a)
         t_notify_b = simulator.tc + (d_epr_creation + d_notify_b)
 
-        epr = WernerStateEntanglement(fidelity=self.init_fidelity, name=uuid.uuid4().hex)
+        epr = WernerStateEntanglement(fidelity=self.init_fidelity, name=self._next_name())
         epr.src = self.own
         epr.dst = next_hop
         epr.attempts = k
@@ -370,7 +419,7 @@ class LinkLayer(Application):
 
         # If the network uses SYNC timing mode but the successful attempt would exceed the current EXTERNAL phase,
         # the EPR would not arrive in time, and therefore is not scheduled.
-        if not self.own.timing.is_external(max(t_notify_a, t_notify_b)):
+        if not self.timing.is_external(max(t_notify_a, t_notify_b)):
             log.debug(
                 f"{self.own}: skip prepare EPR {epr.name} key={epr.key} dst={epr.dst} attempts={k} "
                 f"times={t_epr_creation},{t_notify_a},{t_notify_b} reason=beyond-external-phase"
@@ -388,7 +437,7 @@ class LinkLayer(Application):
         simulator.add_event(LinkArchSuccessEvent(next_hop, epr, t=t_notify_b, by=self))
 
     def handle_success_entangle(self, event: LinkArchSuccessEvent):
-        assert self.own.timing.is_external()
+        assert self.timing.is_external()
 
         simulator = self.simulator
         epr = event.epr
@@ -427,7 +476,7 @@ class LinkLayer(Application):
                 self.fifo_reservation_req.popleft()
         else:  # this node is the EPR initiator
             next_hop, _ = ac
-            if self.own.timing.is_async():
+            if self._is_async:
                 self.start_reservation(next_hop, qubit.qchannel, qubit)
             elif is_decoh:
                 raise Exception(f"{self.own}: UNEXPECTED -> (t_ext + t_int) too short")
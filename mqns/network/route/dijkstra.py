@@ -15,8 +15,6 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any
-
 import numpy as np
 from scipy.sparse.csgraph import dijkstra
 
@@ -36,7 +34,17 @@ class DijkstraRouteAlgorithm(RouteImpl[NodeT, ChannelT]):
                 Defaults to a constant function m(l) = 1.
         """
         self.name = name
-        self.route_table: dict[NodeT, dict[NodeT, tuple[float, list[NodeT]]]] = {}
+        self.nodes: list[NodeT] = []
+        """Nodes in the order of route table indices."""
+        self.node_index: dict[NodeT, int] = {}
+        """Index of each node in `nodes`."""
+        self.route_table: dict[NodeT, tuple[list[float], list[int]]] = {}
+        """
+        Shortest path tree rooted at each source node.
+        Key is source node.
+        Value is [0] metric to each destination index [1] predecessor of each destination index, -9999 if none.
+        Paths are reconstructed on demand in `query`.
+        """
 
         if metric_func is None:
             self.metric_func = lambda _: 1  # hop count
@@ -65,54 +73,30 @@ class DijkstraRouteAlgorithm(RouteImpl[NodeT, ChannelT]):
             return_predecessors=True,
         )
 
-        # Reconstruct path helper
-        def _reconstruct_path(src_idx: int, dst_idx: int) -> list[NodeT]:
-            # Backtrack from dst to src using predecessors
-            path_idx: list[int] = []
-            u = dst_idx
-            while u not in (-9999, src_idx):
-                path_idx.append(u)
-                u = preds[src_idx, u]
-            path_idx.append(src_idx)
-            return [nodes[i] for i in path_idx]
-
+        self.nodes = list(nodes)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
         self.route_table.clear()
-
-        # For each source node, create the per-destination entry
-        for src_idx, src_node in enumerate(nodes):
-            dest_entry: dict[NodeT, Any] = {}
-
-            for dst_idx, dst_node in enumerate(nodes):
-                if src_idx == dst_idx:
-                    # Source to itself
-                    dest_entry[dst_node] = [0.0, [dst_node]]
-                    continue
-
-                hop = dist[src_idx, dst_idx]
-                if np.isinf(hop):  # Unreachable
-                    dest_entry[dst_node] = [self.INF, [dst_node]]
-                else:
-                    path_nodes = _reconstruct_path(src_idx, dst_idx)
-                    dest_entry[dst_node] = [hop, path_nodes]
-
-            self.route_table[src_node] = dest_entry
+        for src_idx, src_node in enumerate(self.nodes):
+            self.route_table[src_node] = (dist[src_idx].tolist(), preds[src_idx].tolist())
 
     def query(self, src: NodeT, dest: NodeT) -> list[tuple[float, NodeT, list[NodeT]]]:
-        ls = self.route_table.get(src, None)
-        if ls is None:
+        tree = self.route_table.get(src, None)
+        dst_idx = self.node_index.get(dest, None)
+        if tree is None or dst_idx is None:
             return []
-        le = ls.get(dest, None)
-        if le is None:
+        dist_row, pred_row = tree
+
+        metric = dist_row[dst_idx]
+        if np.isinf(metric):  # unreachable
             return []
-        try:
-            metric, path = le
-            path = path.copy()
-            path.reverse()
-            if len(path) <= 1 or np.isinf(metric):  # unreachable
-                next_hop = None
-                return []
-            else:
-                next_hop = path[1]
-                return [(metric, next_hop, path)]
-        except Exception:
+
+        # Backtrack from dst to src using predecessors
+        path: list[NodeT] = []
+        u = dst_idx
+        while u != -9999:
+            path.append(self.nodes[u])
+            u = pred_row[u]
+        if len(path) <= 1:  # src == dest
             return []
+        path.reverse()
+        return [(metric, path[1], path)]
@@ -15,12 +15,13 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from mqns.utils.log import critical, debug, error, info, install, logger, monitor, warn
+from mqns.utils.log import critical, debug, debug_enabled, error, info, install, logger, monitor, warn
 from mqns.utils.rnd import get_choice, get_rand, get_randint, set_seed
 
 __all__ = [
     "logger",
     "debug",
+    "debug_enabled",
     "info",
     "error",
     "install",
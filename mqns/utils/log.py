@@ -53,7 +53,18 @@ def install(simulator: "Simulator"):
     logger._simulator = simulator
 
 
+def debug_enabled() -> bool:
+    """
+    Determine whether DEBUG level messages would be logged.
+
+    This should guard `debug` calls whose message is expensive to format, such as f-strings in hot paths.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 def debug(msg, *args):
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     if hasattr(logger, "_simulator"):
         logger.debug(f"[{logger._simulator.tc}] " + msg, *args, stacklevel=2)
     else:
@@ -61,6 +72,8 @@ def debug(msg, *args):
 
 
 def info(msg, *args):
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if hasattr(logger, "_simulator"):
         logger.info(f"[{logger._simulator.tc}] " + msg, *args, stacklevel=2)
     else:
@@ -68,6 +81,8 @@ def info(msg, *args):
 
 
 def error(msg, *args):
+    if not logger.isEnabledFor(logging.ERROR):
+        return
     if hasattr(logger, "_simulator"):
         logger.error(f"[{logger._simulator.tc}] " + msg, *args, stacklevel=2)
     else:
@@ -75,6 +90,8 @@ def error(msg, *args):
 
 
 def warn(msg, *args):
+    if not logger.isEnabledFor(logging.WARNING):
+        return
     if hasattr(logger, "_simulator"):
         logger.warning(f"[{logger._simulator.tc}] " + msg, *args, stacklevel=2)
     else:
@@ -82,6 +99,8 @@ def warn(msg, *args):
 
 
 def critical(msg, *args):
+    if not logger.isEnabledFor(logging.CRITICAL):
+        return
     if hasattr(logger, "_simulator"):
         logger.critical(f"[{logger._simulator.tc}] " + msg, *args, stacklevel=2)
     else:
@@ -20,6 +20,14 @@ from typing import Optional
 
 import numpy as np
 
+rng = random.Random()
+"""
+Python random generator for simulator decisions, such as qubit and path selection.
+
+It is separate from the global `random` module state, so that other code drawing from `random`
+does not change the decisions of a seeded simulation.
+"""
+
 
 def set_seed(seed: Optional[int] = None):
     """Set a seed for random generator
@@ -31,6 +39,7 @@ def set_seed(seed: Optional[int] = None):
     if seed is None:
         return
     random.seed(seed)
+    rng.seed(seed)
     np.random.seed(seed)
 
 
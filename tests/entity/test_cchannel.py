@@ -47,6 +47,23 @@ class SendEvent(Event):
         self.node.send()
 
 
+def test_packet_get():
+    n1, n2 = Node("n1"), Node("n2")
+
+    packet = ClassicPacket(msg="ping", src=n1, dest=n2)
+    assert not packet.is_json
+    assert packet.get() == "ping"
+
+    packet = ClassicPacket(msg={"cmd": "RESERVE_QUBIT", "path_id": None, "key": "n1-1"}, src=n1, dest=n2)
+    assert packet.is_json
+    msg = packet.get()
+    assert msg == {"cmd": "RESERVE_QUBIT", "path_id": None, "key": "n1-1"}
+    assert packet.get() is msg  # decoded once
+
+    packet = ClassicPacket(msg=None, src=n1, dest=n2)
+    assert packet.get() is None
+
+
 def test_cchannel():
     n2 = ClassicRecvNode("n2")
     n1 = ClassicSendNode("n1", dest=n2)
@@ -79,6 +79,18 @@ def test_channel_qubit_assignment_and_search():
     assert q.qchannel == ch
     assert data is None
 
+    # find can be restricted to qubits assigned to a set of qchannels
+    ch2 = QuantumChannel("qch2", length=10)
+    addrs2 = mem.assign(ch2, 2)
+    assert [q.addr for q, _ in mem.find(lambda *_: True, qchannels=["qch2", "qch"])] == sorted(addrs + addrs2)
+    assert [q.addr for q, _ in mem.find(lambda *_: True, qchannels=["qch2"])] == addrs2
+    assert [q.addr for q, _ in mem.find(lambda *_: True, qchannels=[])] == []
+
+    # unassigned qubit is no longer associated with the qchannel
+    mem.unassign(addrs2[0])
+    assert [q.addr for q, _ in mem.get_channel_qubits("qch2")] == addrs2[1:]
+    assert [q.addr for q, _ in mem.find(lambda *_: True, qchannels=["qch2"])] == addrs2[1:]
+
 
 def test_decoherence_event_removes_qubit():
     mem = QuantumMemory("mem", decoherence_rate=1)
@@ -107,6 +119,59 @@ def test_decoherence_event_removes_qubit():
     assert qubit.state == QubitState.RELEASE
 
 
+def test_lookup_by_name():
+    mem = QuantumMemory("mem", capacity=3, decoherence_rate=1)
+
+    node = QNode("n4")
+    node.set_memory(mem)
+
+    sim = Simulator(0, 5)
+    node.install(sim)
+
+    eprs: list[WernerStateEntanglement] = []
+    for name in ("epr-a", "epr-b"):
+        epr = WernerStateEntanglement(name=name)
+        epr.creation_time = sim.tc
+        mem.write(epr)
+        eprs.append(epr)
+
+    assert mem.get("epr-a") == (mem._storage[0][0], eprs[0])
+    assert mem.get("epr-b") == (mem._storage[1][0], eprs[1])
+    assert mem.get("nonexistent") is None
+
+    # update renames the slot
+    epr_c = WernerStateEntanglement(name="epr-c")
+    epr_c.creation_time = sim.tc
+    epr_c.decoherence_time = eprs[1].decoherence_time
+    assert mem.update("epr-b", epr_c) is True
+    assert mem.get("epr-b") is None
+    assert mem.get("epr-c") == (mem._storage[1][0], epr_c)
+
+    # destructive read removes the name
+    assert mem.read("epr-a") is not None
+    assert mem.get("epr-a") is None
+    assert mem.read("epr-a") is None
+    with pytest.raises(IndexError):
+        mem.get("epr-a", must=True)
+
+    # clear removes all names
+    mem.clear()
+    assert mem.get("epr-c") is None
+
+    # duplicate names resolve to the lowest address, like a linear scan
+    q0, q1 = Qubit(name="q"), Qubit(name="q")
+    mem.write(q0, address=1)
+    mem.write(q1, address=0)
+    assert mem.get("q") == (mem._storage[0][0], q1)
+    assert mem.read("q") is not None
+    assert mem.get("q") == (mem._storage[1][0], q0)
+    mem.write(q1, address=2)
+    assert mem.read(2) is not None
+    assert mem.get("q") == (mem._storage[1][0], q0)
+    assert mem.read("q") is not None
+    assert mem.get("q") is None
+
+
 def test_memory_clear_and_deallocate():
     mem = QuantumMemory("mem", capacity=2, decoherence_rate=1)
     mem.assign(QuantumChannel("qc"), mem.capacity)
@@ -1,6 +1,7 @@
 import itertools
 
 import numpy as np
+import pytest
 
 from mqns.models.qubit.const import OPERATOR_RX, OPERATOR_RY, QUBIT_STATE_0, QUBIT_STATE_1, QUBIT_STATE_N
 from mqns.models.qubit.gate import CNOT, CR, CZ, RX, RY, H, Swap, Toffoli, U
@@ -39,6 +40,26 @@ def test_qubit_rotate():
     assert q0.state.equal(q1.state)
 
 
+def test_rotate_operator_cache():
+    op = OPERATOR_RX(np.pi / 4)
+    assert OPERATOR_RX(theta=np.pi / 4) is op
+    assert OPERATOR_RX(np.array(np.pi / 4)) is op  # 0-d array is accepted
+    with pytest.raises(ValueError, match="read-only"):
+        op[0, 0] = 0
+    assert OPERATOR_RY(np.float64(np.pi / 4)) is OPERATOR_RY(np.pi / 4)
+
+
+def test_controlled_operator_cache():
+    for _ in range(2):
+        q0 = Qubit(state=QUBIT_STATE_0, name="q0")
+        q1 = Qubit(state=QUBIT_STATE_0, name="q1")
+        H(q0)
+        CNOT(q0, q1)
+        assert q0.measure() == q1.measure()
+    assert len(CNOT._full_operators) > 0
+    assert all(not operator.flags.writeable for operator in CNOT._full_operators.values())
+
+
 def test_2qubit():
     q0 = Qubit(state=QUBIT_STATE_0, name="q0")
     q1 = Qubit(state=QUBIT_STATE_0, name="q1")
@@ -13,6 +13,7 @@ from mqns.network.proactive import (
     MuxScheme,
     MuxSchemeBufferSpace,
     MuxSchemeDynamicEpr,
+    MuxSchemeStatistical,
     ProactiveForwarder,
     ProactiveRoutingController,
     QubitAllocationType,
@@ -26,6 +27,7 @@ from mqns.network.route import RouteImpl, YenRouteAlgorithm
 from mqns.network.topology import ClassicTopology, GridTopology, LinearTopology, Topology, TreeTopology
 from mqns.simulator import Simulator, func_to_event
 from mqns.utils import log
+from mqns.utils.rnd import set_seed
 
 init_fidelity = 0.90
 
@@ -465,6 +467,86 @@ def test_swap_mp():
     check_e2e_consumed(f1, f4, n_swaps=f2.cnt.n_swapped + f3.cnt.n_swapped, swap_balanced=True, capacity=8)
 
 
+def record_swap_candidates(fw: ProactiveForwarder) -> list[tuple[float, int, list[str]]]:
+    """
+    Record (time, path_id, route) of each swap candidate found by the forwarder's multiplexing scheme.
+    """
+    records: list[tuple[float, int, list[str]]] = []
+    find_swap_candidate = fw.mux.find_swap_candidate
+
+    def wrapper(*args):
+        found = find_swap_candidate(*args)
+        if found is not None:
+            _, fib_entry = found
+            records.append((fw.simulator.tc.sec, fib_entry.path_id, fib_entry.route))
+        return found
+
+    fw.mux.find_swap_candidate = wrapper
+    return records
+
+
+def test_dynamic_epr_path_selection():
+    """Test dynamic EPR multiplexing over two paths on the same route."""
+    set_seed(1)
+    net, simulator = build_linear_network(3, qchannel_capacity=2, mux=MuxSchemeDynamicEpr(), end_time=5.0)
+    ctrl = net.get_controller().get_app(ProactiveRoutingController)
+    f1 = net.get_node("n1").get_app(ProactiveForwarder)
+    f2 = net.get_node("n2").get_app(ProactiveForwarder)
+    f3 = net.get_node("n3").get_app(ProactiveForwarder)
+    records = record_swap_candidates(f2)
+
+    # two paths over the same route, one with a path_id beyond 64 bits
+    for path_id in (0, 70):
+        rp = RoutingPathStatic(["n1", "n2", "n3"], path_id=path_id, m_v=QubitAllocationType.DISABLED, swap=[1, 0, 1])
+        install_path(ctrl, rp)
+    simulator.run()
+
+    for fw in (f1, f2, f3):
+        print(fw.own.name, fw.cnt)
+
+    # both paths are selected, and swapping uses the FIB entry of the selected path
+    assert {path_id for _, path_id, _ in records} == {0, 70}
+    assert all(route == ["n1", "n2", "n3"] for _, _, route in records)
+    assert f2.cnt.n_swapped > 0
+    check_e2e_consumed(f1, f3, n_swaps=f2.cnt.n_swapped, capacity=4)
+
+
+def test_statistical_mux_path_change():
+    """Test statistical multiplexing follows a path_id that is reinstalled over a different route."""
+    net, simulator = build_dumbbell_network(qchannel_capacity=2, mux=MuxSchemeStatistical(), end_time=12.0)
+    ctrl = net.get_controller().get_app(ProactiveRoutingController)
+    f1 = net.get_node("n1").get_app(ProactiveForwarder)
+    f4 = net.get_node("n4").get_app(ProactiveForwarder)
+    f5 = net.get_node("n5").get_app(ProactiveForwarder)
+    f6 = net.get_node("n6").get_app(ProactiveForwarder)
+    records = record_swap_candidates(f1)
+
+    # path_id=0 is first n4-n2-n1-n3-n6 (n1 is a repeater), then n5-n2-n1 (n1 is an end node)
+    route_a = ["n4", "n2", "n1", "n3", "n6"]
+    rp_a = RoutingPathStatic(route_a, path_id=0, m_v=QubitAllocationType.DISABLED, swap=[1, 0, 0, 0, 1])
+    rp_b = RoutingPathStatic(["n5", "n2", "n1"], path_id=0, m_v=QubitAllocationType.DISABLED, swap=[1, 0, 1])
+    install_path(ctrl, rp_a, t_uninstall=2.0)
+    install_path(ctrl, rp_b, t_install=8.0)  # after leftover EPRs of the first path have decohered
+
+    with (
+        CheckUnchanged(simulator, 2.5, 12.0, lambda: (f1.cnt.n_swapped, f4.cnt.n_consumed, f6.cnt.n_consumed)),
+        CheckUnchanged(simulator, 0.0, 8.0, lambda: (f1.cnt.n_consumed, f5.cnt.n_consumed)),
+    ):
+        simulator.run()
+
+    for fw in (f1, f4, f5, f6):
+        print(fw.own.name, fw.cnt)
+
+    # while the first path is installed, n1 swaps with the first path's FIB entry
+    assert len(records) > 0
+    assert all(t < 2.5 and path_id == 0 and route == route_a for t, path_id, route in records)
+    assert f4.cnt.n_consumed > 0
+    assert f6.cnt.n_consumed > 0
+    # after reinstallation, n1 is an end node: it consumes EPRs instead of swapping them
+    assert f1.cnt.n_consumed > 0
+    assert f5.cnt.n_consumed > 0
+
+
 def test_purif_link1r():
     """Test 1-round purification on each link."""
     net, simulator = build_linear_network(3, qchannel_capacity=2)
@@ -0,0 +1,103 @@
+import pytest
+
+from mqns.entity.memory import PathDirection
+from mqns.entity.node import QNode
+from mqns.entity.qchannel import QuantumChannel
+from mqns.models.epr import WernerStateEntanglement
+from mqns.network.proactive import MuxSchemeDynamicEpr, MuxSchemeStatistical
+from mqns.network.proactive.fib import FibEntry
+from mqns.network.proactive.message import PathInstructions
+from mqns.network.proactive.mux_statistical import (
+    MuxSchemeDynamicBase,
+    choose_tmp_path_id,
+    has_intersect_tmp_path_ids,
+    intersect_tmp_path_ids,
+    iter_tmp_path_ids,
+)
+from mqns.utils.rnd import rng, set_seed
+
+
+def test_iter_tmp_path_ids():
+    assert list(iter_tmp_path_ids(0)) == []
+    assert list(iter_tmp_path_ids(1 << 7)) == [7]
+    assert list(iter_tmp_path_ids((1 << 18) | (1 << 0) | (1 << 14) | (1 << 10))) == [0, 10, 14, 18]
+
+
+def test_choose_tmp_path_id():
+    with pytest.raises(ValueError, match="empty range"):
+        choose_tmp_path_id(0)
+
+    assert choose_tmp_path_id(1 << 7) == 7
+
+    path_ids = (1 << 0) | (1 << 10) | (1 << 14) | (1 << 18)
+    set_seed(1312)
+    chosen = [choose_tmp_path_id(path_ids) for _ in range(8)]
+    assert chosen == [14, 10, 10, 0, 18, 14, 0, 0]
+
+    # same draws as choosing from the ascending list of path_ids
+    set_seed(1312)
+    assert chosen == [rng.choice([0, 10, 14, 18]) for _ in range(8)]
+
+
+def make_epr(tmp_path_ids: int | None) -> WernerStateEntanglement:
+    epr = WernerStateEntanglement()
+    epr.tmp_path_ids = tmp_path_ids
+    return epr
+
+
+@pytest.mark.parametrize("mux", [MuxSchemeStatistical(), MuxSchemeDynamicEpr()])
+def test_qchannel_paths_map(mux: MuxSchemeDynamicBase):
+    instructions = PathInstructions(req_id=0, route=["n1", "n2", "n3"], swap=[1, 0, 1], purif={})
+    neighbor = QNode("n1")
+    qc1, qc2 = QuantumChannel("qc1"), QuantumChannel("qc2")
+
+    def change(path_id: int, qchannel: QuantumChannel, *, install: bool):
+        fib_entry = FibEntry(path_id=path_id, req_id=0, route=instructions["route"], own_idx=1, swap=[1, 0, 1], purif={})
+        if install:
+            mux.install_path_neighbor(instructions, fib_entry, PathDirection.LEFT, neighbor, qchannel)
+        else:
+            mux.uninstall_path_neighbor(fib_entry, PathDirection.LEFT, neighbor, qchannel)
+
+    # set bits, including a path_id beyond 64 bits
+    for path_id in (3, 0, 70):
+        change(path_id, qc1, install=True)
+    change(3, qc2, install=True)
+    assert mux.qchannel_paths_map == {"qc1": (1 << 0) | (1 << 3) | (1 << 70), "qc2": 1 << 3}
+    assert list(iter_tmp_path_ids(mux.qchannel_paths_map["qc1"])) == [0, 3, 70]
+
+    # clear bits; the entry is deleted when no path remains
+    change(3, qc1, install=False)
+    assert list(iter_tmp_path_ids(mux.qchannel_paths_map["qc1"])) == [0, 70]
+    with pytest.raises(AssertionError):
+        change(3, qc1, install=False)
+    change(3, qc2, install=False)
+    assert "qc2" not in mux.qchannel_paths_map
+
+
+def test_tmp_path_ids_intersect():
+    assert has_intersect_tmp_path_ids(0b0110, 0b0100)
+    assert not has_intersect_tmp_path_ids(0b0110, 0b1001)
+    assert not has_intersect_tmp_path_ids(None, 0b0110)
+    assert not has_intersect_tmp_path_ids(0b0110, None)
+
+    assert intersect_tmp_path_ids(make_epr(0b0110), make_epr((1 << 70) | 0b0101)) == 0b0100
+    with pytest.raises(Exception, match=r"Cannot select path ID from \[1, 2\] and \[0, 3\]"):
+        intersect_tmp_path_ids(make_epr(0b0110), make_epr(0b1001))
+
+
+def test_tmp_path_ids_swapping():
+    mux = MuxSchemeStatistical()
+    new_epr = make_epr(None)
+    mux.swapping_succeeded(make_epr(0b0111), make_epr(0b1110), new_epr)
+    assert new_epr.tmp_path_ids == 0b0110
+    assert not mux.su_parallel_has_conflict(new_epr, 2)
+
+    merged_epr = make_epr(None)
+    mux.su_parallel_succeeded(merged_epr, new_epr, make_epr(0b0010))
+    assert merged_epr.tmp_path_ids == 0b0010
+
+    mux = MuxSchemeDynamicEpr()
+    new_epr = make_epr(None)
+    mux.swapping_succeeded(make_epr(1 << 5), make_epr(1 << 5), new_epr)
+    assert new_epr.tmp_path_ids == 1 << 5
+    assert not mux.su_parallel_has_conflict(new_epr, 5)